@@ -14,23 +14,35 @@ console.log(
   IS_LOCAL ? '(LOCAL)' : '(CLOUD)'
 );
 
+// Build the start URL and request headers once - they only depend on env vars
+const START_URL = `${API_BASE_URL}/start`;
+
+// Prepare headers - only add Authorization for Pipecat Cloud
+const START_HEADERS: Record<string, string> = {
+  'Content-Type': 'application/json',
+};
+if (!IS_LOCAL) {
+  if (process.env.PIPECAT_CLOUD_API_KEY) {
+    START_HEADERS.Authorization = `Bearer ${process.env.PIPECAT_CLOUD_API_KEY}`;
+  } else {
+    console.warn('PIPECAT_CLOUD_API_KEY is not set');
+  }
+}
+
+// Give up on the start request rather than holding the connection open forever.
+// Keep this well above agent cold-start time: with min_agents = 0 the first
+// request after scale-to-zero waits for an agent to boot, and aborting here
+// does not cancel the agent start on Pipecat Cloud.
+const START_TIMEOUT_MS = Number(process.env.AGENT_START_TIMEOUT_MS) || 60_000;
+
 export async function POST(request: NextRequest) {
   try {
     const MY_CUSTOM_DATA = await request.json();
 
-    // Prepare headers - only add Authorization for cloud
-    const headers: Record<string, string> = {
-      'Content-Type': 'application/json',
-    };
-
-    // Only add auth header for Pipecat Cloud
-    if (!IS_LOCAL && process.env.PIPECAT_CLOUD_API_KEY) {
-      headers.Authorization = `Bearer ${process.env.PIPECAT_CLOUD_API_KEY}`;
-    }
-
-    const response = await fetch(`${API_BASE_URL}/start`, {
+    const response = await fetch(START_URL, {
       method: 'POST',
-      headers,
+      headers: START_HEADERS,
+      signal: AbortSignal.timeout(START_TIMEOUT_MS),
       body: JSON.stringify({
         // Create Daily room
         createDailyRoom: true,
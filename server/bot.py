@@ -21,7 +21,6 @@ import os
 
 from dotenv import load_dotenv
 from loguru import logger
-from PIL import Image
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import (
     BotStartedSpeakingFrame,
@@ -42,23 +41,29 @@ from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.transports.base_transport import BaseTransport
 from pipecat.transports.services.daily import DailyParams, DailyTransport
 
+from sprite_assets import load_sprites
+
 load_dotenv(override=True)
 
-sprites = []
-script_dir = os.path.dirname(__file__)
+# Resolve configuration once per worker rather than on every session
+CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+IS_LOCAL = os.environ.get("ENV") == "local"
+
+# Krisp is only available on Pipecat Cloud, import it once per worker there
+if not IS_LOCAL:
+    from pipecat.audio.filters.krisp_filter import KrispFilter
 
-# Load sequential animation frames
-for i in range(1, 26):
-    # Build the full path to the image file
-    full_path = os.path.join(script_dir, f"assets/robot0{i}.png")
-    # Get the filename without the extension to use as the dictionary key
-    # Open the image and convert it to bytes
-    with Image.open(full_path) as img:
-        sprites.append(OutputImageRawFrame(image=img.tobytes(), size=img.size, format=img.format))
+# Load sequential animation frames, from the baked blob when it's up to date
+sprite_size, sprite_images = load_sprites()
+sprites = [
+    OutputImageRawFrame(image=image, size=sprite_size, format="RGB") for image in sprite_images
+]
 
-# Create a smooth animation by adding reversed frames
-flipped = sprites[::-1]
-sprites.extend(flipped)
+# Create a smooth ping-pong animation by adding the reversed frames, skipping
+# both turnaround frames so none is shown twice when the sequence loops. The
+# reversed half references the same frames, so each image is held once.
+sprites.extend(sprites[-2:0:-1])
 
 # Define static and animated states
 quiet_frame = sprites[0]  # Static frame for when bot is listening
@@ -112,16 +117,16 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     # here as runner_args.body. You can use this to pass in any custom data
     # you need for your bot, such as a custom prompt or other configuration.
     body = runner_args.body
-    logger.info(f"Body: {body}")
+    logger.info("Body: {}", body)
 
     # Initialize text-to-speech service
     tts = CartesiaTTSService(
-        api_key=os.getenv("CARTESIA_API_KEY"),
+        api_key=CARTESIA_API_KEY,
         voice_id="c45bc5ec-dc68-4feb-8829-6e6b2748095d",  # Movieman
     )
 
     # Initialize LLM service
-    llm = OpenAILLMService(api_key=os.getenv("OPENAI_API_KEY"))
+    llm = OpenAILLMService(api_key=OPENAI_API_KEY)
 
     messages = [
         {
@@ -173,12 +178,12 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
 
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, participant):
-        logger.info(f"Client connected")
+        logger.info("Client connected")
         await transport.capture_participant_transcription(participant["id"])
 
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
-        logger.info(f"Client disconnected")
+        logger.info("Client disconnected")
         await task.cancel()
 
     runner = PipelineRunner(handle_sigint=False, force_gc=True)
@@ -189,11 +194,7 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
 async def bot(runner_args: RunnerArguments):
     """Main bot entry point compatible with Pipecat Cloud."""
 
-    transport = None
-
-    if os.environ.get("ENV") != "local":
-        from pipecat.audio.filters.krisp_filter import KrispFilter
-
+    if not IS_LOCAL:
         krisp_filter = KrispFilter()
     else:
         krisp_filter = None
@@ -214,15 +215,11 @@ async def bot(runner_args: RunnerArguments):
         ),
     )
 
-    if transport is None:
-        logger.error("Failed to create transport")
-        return
-
     try:
         await run_bot(transport, runner_args)
         logger.info("Bot process completed")
     except Exception as e:
-        logger.exception(f"Error in bot process: {str(e)}")
+        logger.exception("Error in bot process: {}", e)
         raise
 
 
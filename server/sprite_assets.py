@@ -0,0 +1,139 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Robot animation sprite assets.
+
+Decodes the robot animation PNGs and caches them as a single raw RGB blob
+(``assets/sprites.bin``) so the bot can skip PNG decoding on cold start. The
+Docker image bakes the blob in a build stage and ships it instead of the PNGs.
+
+The blob layout is a little-endian ``width | height | count`` header of three
+uint32 values followed by ``count`` frames of ``width * height * 3`` bytes.
+
+Run this module to (re)build the blob:
+    python sprite_assets.py
+"""
+
+import os
+import struct
+import tempfile
+
+from loguru import logger
+
+SPRITES_HEADER = struct.Struct("<III")
+SPRITE_COUNT = 25
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sprites_blob = os.path.join(script_dir, "assets/sprites.bin")
+
+
+def sprite_paths() -> list[str]:
+    """Return the paths of the sequential animation frames."""
+    return [os.path.join(script_dir, f"assets/robot0{i}.png") for i in range(1, SPRITE_COUNT + 1)]
+
+
+def decode_sprites() -> tuple[tuple[int, int], list[bytes]]:
+    """Decode the animation PNGs into raw RGB frames.
+
+    Returns:
+        The frame size and the raw RGB bytes of each frame
+    """
+    from PIL import Image
+
+    size = None
+    frames = []
+    for path in sprite_paths():
+        with Image.open(path) as img:
+            if size is None:
+                size = img.size
+            elif img.size != size:
+                raise ValueError(f"{path} is {img.size}, expected {size}")
+            frames.append(img.convert("RGB").tobytes())
+    return size, frames
+
+
+def read_sprite_blob() -> tuple[tuple[int, int], list[bytes]] | None:
+    """Read the baked animation frames.
+
+    PNGs that aren't present, e.g. in the Docker image which only ships the
+    blob, are skipped when checking whether the blob is stale.
+
+    Returns:
+        The frame size and the raw RGB bytes of each frame, or None if the blob
+        is missing, older than the PNGs or doesn't match its header
+    """
+    try:
+        blob_mtime = os.path.getmtime(sprites_blob)
+    except FileNotFoundError:
+        return None
+
+    if any(
+        os.path.exists(path) and os.path.getmtime(path) > blob_mtime for path in sprite_paths()
+    ):
+        logger.warning("Ignoring {}, it is older than the sprite PNGs", sprites_blob)
+        return None
+
+    with open(sprites_blob, "rb") as f:
+        header = f.read(SPRITES_HEADER.size)
+        if len(header) < SPRITES_HEADER.size:
+            logger.warning("Ignoring {}, it is too short to hold a header", sprites_blob)
+            return None
+
+        width, height, count = SPRITES_HEADER.unpack(header)
+        if count != SPRITE_COUNT:
+            logger.warning(
+                "Ignoring {}, it holds {} frames, expected {}", sprites_blob, count, SPRITE_COUNT
+            )
+            return None
+
+        stride = width * height * 3
+        expected_size = SPRITES_HEADER.size + count * stride
+        blob_size = os.fstat(f.fileno()).st_size
+        if blob_size != expected_size:
+            logger.warning(
+                "Ignoring {}, it is {} bytes but its header describes {}",
+                sprites_blob,
+                blob_size,
+                expected_size,
+            )
+            return None
+
+        return (width, height), [f.read(stride) for _ in range(count)]
+
+
+def load_sprites() -> tuple[tuple[int, int], list[bytes]]:
+    """Load the animation frames, preferring the baked blob over the PNGs.
+
+    Returns:
+        The frame size and the raw RGB bytes of each frame
+    """
+    return read_sprite_blob() or decode_sprites()
+
+
+def bake_sprites():
+    """Decode the animation PNGs and write them to the raw RGB blob.
+
+    The blob is written to a temporary file first and moved into place, so an
+    interrupted bake never leaves a partial blob behind.
+    """
+    (width, height), frames = decode_sprites()
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sprites_blob), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(SPRITES_HEADER.pack(width, height, len(frames)))
+            for frame in frames:
+                f.write(frame)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, sprites_blob)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+if __name__ == "__main__":
+    bake_sprites()
+    print(f"Wrote {sprites_blob}")